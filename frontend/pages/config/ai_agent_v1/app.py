@@ -1,11 +1,16 @@
 import json
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
+import numpy as np
 import pandas as pd
 import requests
 import streamlit as st
 from plotly.subplots import make_subplots
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from CONFIG import BACKEND_API_HOST, BACKEND_API_PASSWORD, BACKEND_API_PORT, BACKEND_API_USERNAME
 from frontend.components.config_loader import get_default_config_loader
@@ -15,15 +20,15 @@ from frontend.pages.config.utils import get_candles
 from frontend.st_utils import get_backend_api_client, initialize_st_page
 from frontend.visualization import theme
 from frontend.visualization.backtesting import create_backtesting_figure
-from frontend.visualization.backtesting_metrics import (
-    render_accuracy_metrics,
-    render_backtesting_metrics,
-    render_close_types
-)
 from frontend.visualization.candles import get_candlestick_trace
 from frontend.visualization.indicators import get_volume_trace
 from frontend.visualization.utils import add_traces_to_fig
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib parser
+    orjson = None
+
 # Initialize the Streamlit page
 initialize_st_page(title="AI Agent V1", icon="🤖", initial_sidebar_state="expanded")
 backend_api_client = get_backend_api_client()
@@ -36,6 +41,66 @@ else:
 
 AUTH = (BACKEND_API_USERNAME, BACKEND_API_PASSWORD)
 
+# Backtesting API endpoints (per-run endpoints are templates filled with run_id)
+BACKTESTING_START_URL = f"{API_BASE_URL}/backtesting/start"
+BACKTESTING_LIST_URL = f"{API_BASE_URL}/backtesting/list"
+BACKTESTING_STATUS_URL = f"{API_BASE_URL}/backtesting/status/{{run_id}}"
+BACKTESTING_RESULTS_URL = f"{API_BASE_URL}/backtesting/results/{{run_id}}"
+BACKTESTING_STOP_URL = f"{API_BASE_URL}/backtesting/stop/{{run_id}}"
+
+MAX_PREVIEW_CANDLES = 2000  # Candles above this are bucketed before plotting
+MONITOR_REFRESH_INTERVAL = 5  # seconds
+LOGS_PAGE_SIZE = 20  # Log expanders rendered per page in the results viewer
+OPENROUTER_API_KEY_PATTERN = re.compile(r"sk-or-[A-Za-z0-9_-]{20,}")
+
+# Backtest run status and log level display
+STATUS_EMOJI = {"PENDING": "⏳", "RUNNING": "🏃", "COMPLETED": "✅", "FAILED": "❌", "CANCELLED": "🛑"}
+STATUS_PRIORITY = {"RUNNING": 0, "PENDING": 1, "COMPLETED": 2, "FAILED": 3, "CANCELLED": 4}
+LOG_LEVEL_EMOJI = {"INFO": "ℹ️", "DEBUG": "🐛", "WARNING": "⚠️", "ERROR": "❌"}
+
+# Number formats of the results trades table (see build_trades_table)
+TRADES_COLUMN_CONFIG = {
+    "Entry Price": st.column_config.NumberColumn(format="$%.2f"),
+    "Exit Price": st.column_config.NumberColumn(format="$%.2f"),
+    "Amount": st.column_config.NumberColumn(format="%.4f"),
+    "PnL %": st.column_config.NumberColumn(format="%.2f%%"),
+    "PnL Quote": st.column_config.NumberColumn(format="$%.2f"),
+}
+
+# Controller config fields sent with a backtest request (openrouter_api_key is deliberately left out)
+BACKTEST_CONFIG_KEYS = (
+    "controller_name", "controller_type", "connector_name", "trading_pair", "total_amount_quote", "trading_pairs",
+    "max_concurrent_positions", "single_position_size_pct", "decision_interval", "candles_connector",
+    "candles_trading_pair", "candles_interval", "interval", "candles_max_records", "llm_model", "llm_temperature",
+    "llm_max_tokens", "leverage", "position_mode", "stop_loss", "take_profit", "time_limit", "trailing_stop",
+    "custom_system_prompt",
+)
+
+
+@st.cache_resource
+def get_http_session():
+    """
+    Shared HTTP session for the backtesting API.
+    
+    Streamlit re-executes this script on every rerun, so the session is kept in
+    st.cache_resource to let pooled keep-alive connections survive across reruns.
+    """
+    session = requests.Session()
+    session.auth = AUTH
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=Retry(total=2, backoff_factor=0.1))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_resource
+def get_request_executor():
+    """Thread pool used to issue independent backtesting API requests concurrently."""
+    return ThreadPoolExecutor(max_workers=4)
+
+
+SESSION = get_http_session()
+
 
 # ============================================================================
 # Helper Functions
@@ -56,6 +121,10 @@ def safe_float_format(value, precision=2, prefix="", suffix="", multiplier=1, de
     Returns:
         Formatted string or default value
     """
+    # Fast path for plain floats, the common case for API payloads
+    if type(value) is float:
+        return f"{prefix}{value * multiplier:.{precision}f}{suffix}"
+    
     try:
         if value is None:
             return default
@@ -77,6 +146,26 @@ def safe_float_format(value, precision=2, prefix="", suffix="", multiplier=1, de
         return default
 
 
+def safe_float_format_series(values, precision=2, prefix="", suffix="", multiplier=1, default="N/A"):
+    """
+    Vectorized counterpart of safe_float_format for a whole column.
+    
+    Args:
+        values: Series or list-like of values (can mix None, str, int, float)
+        precision: Number of decimal places
+        prefix: String to prepend (e.g., "$")
+        suffix: String to append (e.g., "%")
+        multiplier: Multiply values before formatting (e.g., 100 for percentages)
+        default: Value used for entries that cannot be parsed
+    
+    Returns:
+        Series of formatted strings, keeping the index of the input
+    """
+    numeric = pd.to_numeric(pd.Series(values, dtype="object"), errors="coerce") * multiplier
+    formatted = prefix + numeric.map(f"{{:.{precision}f}}".format).astype(str) + suffix
+    return formatted.where(numeric.notna(), default)
+
+
 def safe_get_json_response(response):
     """
     Safely parse JSON response with error handling.
@@ -88,41 +177,483 @@ def safe_get_json_response(response):
         Parsed JSON data or None with error message
     """
     try:
-        return response.json(), None
+        # Parse the raw bytes directly, skipping the full-body decode to str
+        if orjson is not None:
+            return orjson.loads(response.content), None
+        return json.loads(response.content), None
     except json.JSONDecodeError as e:
-        error_msg = f"Invalid JSON response: {str(e)}\nResponse text: {response.text[:200]}"
+        # Only decode the slice shown in the message, not the whole body
+        body_preview = response.content[:200].decode("utf-8", "replace")
+        error_msg = f"Invalid JSON response: {str(e)}\nResponse text: {body_preview}"
         return None, error_msg
     except Exception as e:
         error_msg = f"Error parsing response: {str(e)}"
         return None, error_msg
 
 
-# ============================================================================
-# Streamlit UI
-# ============================================================================
+@st.cache_data(ttl=5, show_spinner=False)
+def fetch_runs(limit, status=None):
+    """
+    Fetch the list of backtest runs, cached briefly so unrelated reruns reuse it.
+    
+    Args:
+        limit: Maximum number of runs to return
+        status: Optional status filter (e.g. "COMPLETED")
+    
+    Returns:
+        Parsed /backtesting/list response
+    
+    Raises:
+        RuntimeError: If the request fails or the response is not valid JSON
+    """
+    params = {"limit": limit}
+    if status:
+        params["status"] = status
+    
+    response = SESSION.get(BACKTESTING_LIST_URL, params=params, timeout=10)
+    if response.status_code != 200:
+        raise RuntimeError(f"{response.status_code} - {response.text}")
+    
+    data, error = safe_get_json_response(response)
+    if error:
+        raise RuntimeError(error)
+    return data
+
+
+def fetch_results(run_id, include_logs=False, log_limit=100):
+    """
+    Fetch the results of a backtest run, optionally with its most recent logs.
+    
+    Not cached: the results viewer keeps the summary per opened run in session state.
+    
+    Args:
+        run_id: Backtest run to fetch
+        include_logs: Whether to include logs in the response
+        log_limit: Maximum number of logs to include
+    
+    Returns:
+        Parsed /backtesting/results response
+    
+    Raises:
+        RuntimeError: If the request fails or the response is not valid JSON
+    """
+    response = SESSION.get(
+        BACKTESTING_RESULTS_URL.format(run_id=run_id),
+        params={"include_logs": include_logs, "log_limit": log_limit},
+        timeout=30
+    )
+    if response.status_code != 200:
+        raise RuntimeError(f"{response.status_code} - {response.text}")
+    
+    data, error = safe_get_json_response(response)
+    if error:
+        raise RuntimeError(error)
+    return data
+
+
+@st.cache_data(ttl=300, show_spinner=False, max_entries=16)
+def fetch_results_logs(run_id, log_limit=100):
+    """
+    Fetch the most recent logs of a backtest run, cached so the log filters and pages reuse them.
+    
+    Args:
+        run_id: Backtest run to fetch
+        log_limit: Maximum number of logs to include
+    
+    Returns:
+        List of logs
+    
+    Raises:
+        RuntimeError: If the request fails or the response is not valid JSON
+    """
+    return fetch_results(run_id, include_logs=True, log_limit=log_limit).get("logs", [])
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_history_table(runs):
+    """
+    Build the history table for a list of runs with column-wise operations.
+    
+    Args:
+        runs: List of run dicts from /backtesting/list
+    
+    Returns:
+        DataFrame with the formatted display columns ("Created" is a UTC datetime column)
+    """
+    df = pd.DataFrame.from_records(
+        runs,
+        columns=["run_id", "run_name", "controller_name", "status", "total_trades", "net_pnl_pct", "win_rate", "created_at"]
+    )
+    return pd.DataFrame({
+        "Run ID": df["run_id"].str.slice(0, 8) + "...",
+        "Name": df["run_name"].fillna("N/A"),
+        "Controller": df["controller_name"].fillna("N/A"),
+        "Status": df["status"].fillna("UNKNOWN"),
+        "Trades": pd.to_numeric(df["total_trades"], errors="coerce").fillna(0).astype(int),
+        "Net PnL %": safe_float_format_series(df["net_pnl_pct"], precision=2, multiplier=100, suffix="%"),
+        "Win Rate": safe_float_format_series(df["win_rate"], precision=1, multiplier=100, suffix="%"),
+        "Created": pd.to_datetime(df["created_at"], errors="coerce", utc=True, format="ISO8601").dt.tz_localize(None),
+    })
+
+
+def build_trades_table(trades):
+    """
+    Build the trades table of a backtest result with column-wise operations.
+    
+    Numeric columns stay numeric and text columns with few distinct values are
+    categorical, which keeps the Arrow payload sent to the browser small. Number
+    formatting is applied by TRADES_COLUMN_CONFIG.
+    
+    Args:
+        trades: List of trade dicts from /backtesting/results
+    
+    Returns:
+        DataFrame with the display columns
+    """
+    df = pd.DataFrame.from_records(
+        trades,
+        columns=["trading_pair", "side", "entry_price", "exit_price", "amount", "net_pnl_pct", "net_pnl_quote",
+                 "close_type", "status"]
+    )
+    numeric = df[["entry_price", "exit_price", "amount", "net_pnl_pct", "net_pnl_quote"]].apply(pd.to_numeric, errors="coerce")
+    # Zero prices and amounts are shown as empty, like missing ones
+    numeric[["entry_price", "exit_price", "amount"]] = numeric[["entry_price", "exit_price", "amount"]].replace(0, np.nan)
+    numeric["net_pnl_pct"] = numeric["net_pnl_pct"] * 100
+    return pd.DataFrame({
+        "Symbol": df["trading_pair"].fillna("N/A").astype("category"),
+        "Side": df["side"].fillna("N/A").astype("category"),
+        "Entry Price": numeric["entry_price"],
+        "Exit Price": numeric["exit_price"],
+        "Amount": numeric["amount"],
+        "PnL %": numeric["net_pnl_pct"],
+        "PnL Quote": numeric["net_pnl_quote"],
+        "Close Type": df["close_type"].fillna("N/A").astype("category"),
+        "Status": df["status"].fillna("N/A").astype("category"),
+    })
+
+
+def build_backtest_config(inputs):
+    """
+    Controller config for the backtesting API from the user inputs.
+    
+    Args:
+        inputs: Dictionary returned by user_inputs()
+    
+    Returns:
+        Dictionary with the BACKTEST_CONFIG_KEYS fields
+    """
+    return {key: inputs.get(key) for key in BACKTEST_CONFIG_KEYS}
+
+
+def downsample_candles(candles, max_points=MAX_PREVIEW_CANDLES):
+    """
+    Aggregate consecutive candles into OHLCV buckets so at most max_points are plotted.
+    
+    Args:
+        candles: DataFrame with timestamp/open/high/low/close/volume columns
+        max_points: Maximum number of candles to keep
+    
+    Returns:
+        The original DataFrame if it is small enough, otherwise the bucketed one
+    """
+    ohlcv_agg = {"timestamp": "first", "open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+    if len(candles) <= max_points or not set(ohlcv_agg).issubset(candles.columns):
+        return candles
+    
+    bucket_size = -(-len(candles) // max_points)  # ceil division keeps the result within max_points
+    downsampled = candles.groupby(np.arange(len(candles)) // bucket_size).agg(ohlcv_agg)
+    downsampled.index = pd.to_datetime(downsampled["timestamp"], unit="s")
+    return downsampled
+
 
+def load_preview_candles(connector_name, trading_pair, interval, days):
+    """
+    Load candles for the preview, reusing the widest window already fetched in this session.
+    
+    Narrowing the window is served by slicing the stored DataFrame; only a wider
+    window than any seen before triggers a new fetch.
+    
+    Args:
+        connector_name: Connector to fetch candles from
+        trading_pair: Trading pair to fetch
+        interval: Candle interval (e.g. "5m")
+        days: Number of days to show
+    
+    Returns:
+        DataFrame with the candles of the last `days` days
+    """
+    cache_key = f"candles_{connector_name}_{trading_pair}_{interval}"
+    cached = st.session_state.get(cache_key)
+    
+    if cached is None or cached["days"] < days:
+        candles = get_candles(connector_name=connector_name, trading_pair=trading_pair, interval=interval, days=days)
+        st.session_state[cache_key] = {"days": days, "candles": candles}
+        return candles
+    
+    candles = cached["candles"]
+    if cached["days"] == days or candles.empty or "timestamp" not in candles.columns:
+        return candles
+    cutoff = candles["timestamp"].iloc[-1] - days * 24 * 60 * 60
+    return candles[candles["timestamp"] >= cutoff]
+
+
+def clear_preview_candles(connector_name, trading_pair, interval):
+    """
+    Drop the preview candles of this session so the next load fetches new ones.
+    
+    get_candles is cached without expiry and shared by all sessions and config pages,
+    so only its entry for the window this session fetched is cleared.
+    
+    Args:
+        connector_name: Connector of the preview candles
+        trading_pair: Trading pair of the preview candles
+        interval: Candle interval (e.g. "5m")
+    """
+    cached = st.session_state.pop(f"candles_{connector_name}_{trading_pair}_{interval}", None)
+    if cached is not None:
+        get_candles.clear(connector_name=connector_name, trading_pair=trading_pair, interval=interval, days=cached["days"])
+
+
+def _candles_fingerprint(candles):
+    """Cache key for a candles DataFrame: row count, last timestamp and a hash of the values."""
+    content_hash = int(pd.util.hash_pandas_object(candles, index=False).sum()) if not candles.empty else 0
+    if candles.empty or "timestamp" not in candles.columns:
+        return len(candles), None, content_hash
+    return len(candles), candles["timestamp"].iloc[-1], content_hash
+
+
+@st.cache_data(ttl=60, max_entries=32, show_spinner=False, hash_funcs={pd.DataFrame: _candles_fingerprint})
+def build_candles_figure(candles, connector_name, trading_pair, interval, days):
+    """
+    Build the price/volume preview figure for a candles DataFrame.
+    
+    Cached so reruns triggered by unrelated widgets reuse the figure instead of
+    rebuilding the traces and layout. The candles are keyed by _candles_fingerprint,
+    the connector, interval and days are part of the key as well.
+    
+    Args:
+        candles: DataFrame returned by get_candles
+        connector_name: Connector the candles come from
+        trading_pair: Trading pair shown in the price subplot title
+        interval: Candle interval (e.g. "5m")
+        days: Number of days shown
+    
+    Returns:
+        Plotly figure with candlestick and volume subplots
+    """
+    candles = downsample_candles(candles)
+    
+    # Create a subplot with 2 rows
+    fig = make_subplots(
+        rows=2, cols=1, shared_xaxes=True,
+        vertical_spacing=0.02,
+        subplot_titles=(f'{trading_pair} - Price', 'Volume'),
+        row_heights=[0.8, 0.2]
+    )
+    
+    add_traces_to_fig(fig, [get_candlestick_trace(candles)], row=1, col=1)
+    add_traces_to_fig(fig, [get_volume_trace(candles)], row=2, col=1)
+    
+    # The preview is rendered as a static plot, so per-point hover text is never shown
+    fig.update_traces(hoverinfo="skip")
+    fig.update_layout(**theme.get_default_layout())
+    return fig
 
-st.markdown("""
-## 🤖 AI Agent V1 - LLM-Powered Trading Controller
 
-This AI trading agent uses LangChain and OpenRouter to make intelligent trading decisions based on:
-- **Technical Indicators**: RSI, MACD, EMA, price action
-- **Market Data**: Real-time prices, funding rates (for perpetuals)
-- **Historical Performance**: Learning from past trades
-- **Multi-Asset**: Monitors multiple trading pairs simultaneously
+def monitor_run_detail(monitor_run_id, auto_refresh, polling):
+    """
+    Status, metrics and recent logs of one backtest run.
+    
+    Meant to be wrapped in st.fragment, so the refresh timer and the "Update Status"
+    button only rerun this block instead of the whole page.
+    
+    Args:
+        monitor_run_id: Backtest run to display
+        auto_refresh: Whether the user enabled auto-refresh
+        polling: Whether the fragment was set up with a refresh timer
+    """
+    col1, col2 = st.columns([4, 1])
+    with col1:
+        st.caption(f"Last updated: {datetime.now().strftime('%H:%M:%S')}")
+    with col2:
+        if st.button("🔄 Update Status", use_container_width=True, key="refresh_status_detail"):
+            st.rerun(scope="fragment")
+    
+    try:
+        # Fetch status, and the recent logs in parallel if the run was RUNNING on the previous rerun
+        executor = get_request_executor()
+        status_future = executor.submit(SESSION.get, BACKTESTING_STATUS_URL.format(run_id=monitor_run_id), timeout=10)
+        logs_future = None
+        if (st.session_state.get("monitor_last_status") == (monitor_run_id, "RUNNING")
+                and "view_live_logs_run_id" not in st.session_state):
+            logs_future = executor.submit(
+                SESSION.get,
+                BACKTESTING_RESULTS_URL.format(run_id=monitor_run_id),
+                params={"include_logs": True, "log_limit": 10},
+                timeout=10
+            )
+        response = status_future.result()
+        
+        if response.status_code == 200:
+            data, error = safe_get_json_response(response)
+            if error:
+                st.error(f"❌ {error}")
+            else:
+                status_data = data
+                
+                # Display status
+                status = status_data.get("status", "UNKNOWN")
+                st.session_state["monitor_last_status"] = (monitor_run_id, status)
+                
+                # Full rerun to start the timer once the run is seen in an active state, and to stop it
+                # once a polled run has finished (polling already implies the run was seen active)
+                if auto_refresh and (status in ["PENDING", "RUNNING"]) != polling:
+                    st.rerun()
+                status_emoji = STATUS_EMOJI.get(status, "❓")
+                
+                st.write(f"### {status_emoji} Status: **{status}**")
+                
+                # Display key metrics
+                col1, col2, col3, col4 = st.columns(4)
+                
+                with col1:
+                    st.metric("Run Name", status_data.get("run_name", "N/A"))
+                    
+                with col2:
+                    st.metric("Controller", status_data.get("controller_name", "N/A"))
+                    
+                with col3:
+                    total_trades = status_data.get("total_trades")
+                    st.metric("Total Trades", total_trades if total_trades is not None else "N/A")
+                    
+                with col4:
+                    net_pnl_pct = status_data.get("net_pnl_pct")
+                    pnl_display = safe_float_format(net_pnl_pct, precision=2, multiplier=100, suffix="%")
+                    st.metric("Net PnL", pnl_display, delta=pnl_display if net_pnl_pct is not None else None)
+                
+                # Show more metrics if completed
+                if status == "COMPLETED":
+                    st.write("---")
+                    col1, col2, col3, col4 = st.columns(4)
+                    
+                    with col1:
+                        win_rate = status_data.get("win_rate")
+                        win_rate_display = safe_float_format(win_rate, precision=1, multiplier=100, suffix="%")
+                        st.metric("Win Rate", win_rate_display)
+                    
+                    with col2:
+                        sharpe = status_data.get("sharpe_ratio")
+                        sharpe_display = safe_float_format(sharpe, precision=2)
+                        st.metric("Sharpe Ratio", sharpe_display)
+                    
+                    with col3:
+                        max_dd = status_data.get("max_drawdown")
+                        max_dd_display = safe_float_format(max_dd, precision=2, multiplier=100, suffix="%")
+                        st.metric("Max Drawdown", max_dd_display)
+                    
+                    with col4:
+                        net_pnl_quote = status_data.get("net_pnl_quote")
+                        net_pnl_quote_display = safe_float_format(net_pnl_quote, precision=2, prefix="$")
+                        st.metric("Net PnL (USDT)", net_pnl_quote_display)
+                
+                # Show timing info
+                with st.expander("⏱️ Timing Details"):
+                    st.markdown(
+                        f"**Created:** {status_data.get('created_at', 'N/A')}\n\n"
+                        f"**Started:** {status_data.get('started_at', 'N/A')}\n\n"
+                        f"**Completed:** {status_data.get('completed_at', 'N/A')}"
+                    )
+                
+                # Show error if failed
+                if status == "FAILED":
+                    st.error(f"**Error:** {status_data.get('error_message', 'Unknown error')}")
+                
+                # Show stop button if running
+                if status in ["PENDING", "RUNNING"]:
+                    col1, col2 = st.columns([1, 1])
+                    with col1:
+                        if st.button("🛑 Stop Backtest", type="secondary", use_container_width=True):
+                            try:
+                                stop_response = SESSION.post(
+                                    BACKTESTING_STOP_URL.format(run_id=monitor_run_id),
+                                    timeout=10
+                                )
+                                
+                                if stop_response.status_code == 200:
+                                    st.success("✅ Stop signal sent")
+                                    time.sleep(1)
+                                    st.rerun()
+                                else:
+                                    st.error(f"❌ Failed to stop: {stop_response.text}")
+                            except Exception as e:
+                                st.error(f"❌ Error: {e}")
+                    
+                    with col2:
+                        if st.button("📜 View Live Logs", type="primary", use_container_width=True):
+                            st.session_state["view_live_logs_run_id"] = monitor_run_id
+                            st.rerun()
+                
+                # Show results button if completed
+                if status == "COMPLETED":
+                    st.write("---")
+                    col1, col2 = st.columns([1, 1])
+                    with col1:
+                        if st.button("📊 View Full Results", type="primary", use_container_width=True):
+                            st.session_state["view_results_run_id"] = monitor_run_id
+                            st.session_state["view_results_version"] = time.time()
+                            st.rerun()
+                    with col2:
+                        if st.button("📜 View All Logs", type="secondary", use_container_width=True):
+                            st.session_state["view_live_logs_run_id"] = monitor_run_id
+                            st.rerun()
+                
+                # Live logs preview (for RUNNING status)
+                if status == "RUNNING" and "view_live_logs_run_id" not in st.session_state:
+                    st.write("---")
+                    st.write("#### 📜 Recent Logs (Last 10)")
+                    
+                    try:
+                        if logs_future is not None:
+                            logs_response = logs_future.result()
+                        else:
+                            logs_response = SESSION.get(
+                                BACKTESTING_RESULTS_URL.format(run_id=monitor_run_id),
+                                params={"include_logs": True, "log_limit": 10},
+                                timeout=10
+                            )
+                        
+                        if logs_response.status_code == 200:
+                            logs_data, logs_error = safe_get_json_response(logs_response)
+                            if not logs_error:
+                                logs = logs_data.get("logs", [])
+                                if logs:
+                                    for log in reversed(logs[-10:]):  # Show most recent first
+                                        if not isinstance(log, dict):
+                                            continue
+                                        
+                                        log_level = log.get("log_level", "INFO")
+                                        log_emoji = LOG_LEVEL_EMOJI.get(log_level, "📝")
+                                        
+                                        timestamp = (log.get("timestamp") or "")[:19]
+                                        category = log.get("log_category", "UNKNOWN")
+                                        message = (log.get("log_message") or "")[:150]
+                                        
+                                        st.text(f"{log_emoji} [{timestamp}] {category}: {message}...")
+                                else:
+                                    st.info("No logs yet")
+                    except Exception as e:
+                        st.warning(f"Could not fetch logs: {e}")
+            
+        else:
+            st.error(f"❌ Failed to fetch status: {response.status_code} - {response.text}")
+            
+    except Exception as e:
+        st.error(f"❌ Error fetching status: {e}")
 
-### 🎯 How it works:
-1. **Data Collection**: Gathers market data and technical indicators for all trading pairs
-2. **AI Decision**: Uses LLM to analyze data and generate trading signals
-3. **Risk Management**: Validates decisions and applies position sizing rules
-4. **Execution**: Opens/closes positions based on AI recommendations
 
-### ⚠️ Important Notes:
-- Requires a valid **OpenRouter API Key** (get one at https://openrouter.ai)
-- LLM calls are **real** and will incur costs (recommend using `deepseek/deepseek-chat` for low cost)
-- Backtesting will make **actual API calls** to the LLM
-- This is an **experimental** controller - use with caution!
-""")
+# ============================================================================
+# Streamlit UI
+# ============================================================================
 
 get_default_config_loader("ai_agent_v1")
 
@@ -130,9 +661,13 @@ get_default_config_loader("ai_agent_v1")
 inputs = user_inputs()
 st.session_state["default_config"].update(inputs)
 
-# Validate API key
-if not inputs.get("openrouter_api_key"):
+# Validate API key (an empty key is allowed, the backend then falls back to OPENROUTER_API_KEY)
+openrouter_api_key = inputs.get("openrouter_api_key")
+api_key_malformed = bool(openrouter_api_key) and not OPENROUTER_API_KEY_PATTERN.fullmatch(openrouter_api_key)
+if not openrouter_api_key:
     st.warning("⚠️ Please enter your OpenRouter API Key in the AI Configuration section!")
+elif api_key_malformed:
+    st.error("❌ The OpenRouter API Key looks malformed (OpenRouter keys start with `sk-or-`)")
 else:
     st.success("✅ OpenRouter API Key configured")
 
@@ -141,30 +676,32 @@ st.write("### 📊 Market Data Preview")
 st.write(f"**Monitoring:** {', '.join(inputs['trading_pairs'])}")
 
 # Show candles for the first trading pair
-days_to_visualize = st.number_input("Days to Visualize", min_value=1, max_value=30, value=7)
+col1, col2 = st.columns([4, 1])
+with col1:
+    days_to_visualize = st.number_input("Days to Visualize", min_value=1, max_value=30, value=7)
+with col2:
+    st.write("")  # Spacing
+    st.write("")  # Spacing
+    if st.button("🔄 Refresh Candles", use_container_width=True) and inputs["trading_pairs"]:
+        clear_preview_candles(inputs["connector_name"], inputs["trading_pairs"][0], inputs["candles_interval"])
 
 try:
     # Load candle data for the primary trading pair
-    candles = get_candles(
+    candles = load_preview_candles(
         connector_name=inputs["connector_name"],
         trading_pair=inputs["trading_pairs"][0],
         interval=inputs["candles_interval"],
         days=days_to_visualize
     )
     
-    # Create a subplot with 2 rows
-    fig = make_subplots(
-        rows=2, cols=1, shared_xaxes=True,
-        vertical_spacing=0.02,
-        subplot_titles=(f'{inputs["trading_pairs"][0]} - Price', 'Volume'),
-        row_heights=[0.8, 0.2]
+    fig = build_candles_figure(
+        candles,
+        connector_name=inputs["connector_name"],
+        trading_pair=inputs["trading_pairs"][0],
+        interval=inputs["candles_interval"],
+        days=days_to_visualize
     )
-    
-    add_traces_to_fig(fig, [get_candlestick_trace(candles)], row=1, col=1)
-    add_traces_to_fig(fig, [get_volume_trace(candles)], row=2, col=1)
-    
-    fig.update_layout(**theme.get_default_layout())
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, config={"staticPlot": True, "displayModeBar": False})
     
 except Exception as e:
     st.error(f"Error loading candles: {e}")
@@ -186,7 +723,10 @@ with tab_config:
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        run_name = st.text_input("Backtest Name", value=f"AI Agent Test {datetime.now().strftime('%Y%m%d_%H%M')}")
+        # Fix the default name once per session so the widget's default does not change every minute
+        if "default_run_name" not in st.session_state:
+            st.session_state["default_run_name"] = f"AI Agent Test {datetime.now().strftime('%Y%m%d_%H%M')}"
+        run_name = st.text_input("Backtest Name", value=st.session_state["default_run_name"], key="run_name_input")
         
     with col2:
         default_end_time = datetime.now().date() - timedelta(days=1)
@@ -204,41 +744,12 @@ with tab_config:
     with col5:
         trade_cost = st.number_input("Trade Cost (%)", min_value=0.0, max_value=1.0, value=0.06, step=0.01, format="%.3f")
     
-    # Build config for API call
-    backtest_config = {
-        "controller_name": inputs["controller_name"],
-        "controller_type": inputs["controller_type"],
-        "connector_name": inputs["connector_name"],
-        "trading_pair": inputs["trading_pair"],
-        "total_amount_quote": inputs["total_amount_quote"],
-        "trading_pairs": inputs["trading_pairs"],
-        "max_concurrent_positions": inputs["max_concurrent_positions"],
-        "single_position_size_pct": inputs["single_position_size_pct"],
-        "decision_interval": inputs["decision_interval"],
-        "candles_connector": inputs["candles_connector"],
-        "candles_trading_pair": inputs["candles_trading_pair"],
-        "candles_interval": inputs["candles_interval"],
-        "interval": inputs["interval"],
-        "candles_max_records": inputs["candles_max_records"],
-        # "openrouter_api_key": inputs["openrouter_api_key"],
-        "llm_model": inputs["llm_model"],
-        "llm_temperature": inputs["llm_temperature"],
-        "llm_max_tokens": inputs["llm_max_tokens"],
-        "leverage": inputs["leverage"],
-        "position_mode": inputs["position_mode"],
-        "stop_loss": inputs["stop_loss"],
-        "take_profit": inputs["take_profit"],
-        "time_limit": inputs["time_limit"],
-        "trailing_stop": inputs["trailing_stop"],
-        "custom_system_prompt": inputs.get("custom_system_prompt")
-    }
-    
-    # Show config preview
-    with st.expander("📋 View Full Config"):
-        st.json(backtest_config)
+    # Show config preview (only serialized when requested)
+    if st.checkbox("📋 Show Full Config", value=False, key="show_full_config"):
+        st.json(build_backtest_config(inputs))
     
     # Start backtest button
-    if st.button("🚀 Start Backtest", type="primary", use_container_width=True):
+    if st.button("🚀 Start Backtest", type="primary", use_container_width=True, disabled=api_key_malformed):
         start_datetime = datetime.combine(start_date, datetime.min.time())
         end_datetime = datetime.combine(end_date, datetime.max.time())
         
@@ -248,29 +759,31 @@ with tab_config:
             "end_time": int(end_datetime.timestamp()),
             "backtesting_resolution": backtesting_resolution,
             "trade_cost": trade_cost / 100,
-            "config": backtest_config
+            "config": build_backtest_config(inputs)
         }
         
         try:
             with st.spinner("Starting backtest..."):
-                response = requests.post(
-                    f"{API_BASE_URL}/backtesting/start",
+                response = SESSION.post(
+                    BACKTESTING_START_URL,
                     json=payload,
-                    auth=AUTH,
                     timeout=10
                 )
                 
                 if response.status_code == 200:
-                    result = response.json()
-                    run_id = result.get("run_id")
-                    st.success(f"✅ Backtest started successfully!")
-                    st.info(f"**Run ID:** `{run_id}`")
-                    st.info("Switch to the **Monitor Runs** tab to track progress")
-                    
-                    # Store in session state for easy access
-                    if "active_runs" not in st.session_state:
-                        st.session_state["active_runs"] = []
-                    st.session_state["active_runs"].append(run_id)
+                    result, error = safe_get_json_response(response)
+                    if error:
+                        st.error(f"❌ {error}")
+                    else:
+                        run_id = result.get("run_id")
+                        st.success(f"✅ Backtest started successfully!")
+                        st.info(f"**Run ID:** `{run_id}`")
+                        st.info("Switch to the **Monitor Runs** tab to track progress")
+                        
+                        # Store in session state for easy access
+                        if "active_runs" not in st.session_state:
+                            st.session_state["active_runs"] = []
+                        st.session_state["active_runs"].append(run_id)
                 else:
                     st.error(f"❌ Failed to start backtest: {response.status_code} - {response.text}")
                     
@@ -288,127 +801,67 @@ with tab_monitor:
     
     with col2:
         if st.button("🔄 Refresh List", use_container_width=True, key="refresh_monitor_list"):
-            # Force refresh by clearing cache
+            # Force refresh by clearing the cached list this tab uses
+            fetch_runs.clear(20, None)
             if "monitor_selected_run" in st.session_state:
                 del st.session_state["monitor_selected_run"]
             st.rerun()
     
     try:
         # Fetch recent runs (prioritize RUNNING and PENDING)
-        response = requests.get(
-            f"{API_BASE_URL}/backtesting/list",
-            params={"limit": 20},
-            auth=AUTH,
-            timeout=10
-        )
+        runs = fetch_runs(20, None).get("runs", [])
         
-        if response.status_code == 200:
-            data, error = safe_get_json_response(response)
-            if error:
-                st.error(f"❌ {error}")
-                monitor_run_id = None
-            else:
-                runs = data.get("runs", [])
-                
-                if runs and len(runs) > 0:
-                    # Sort: RUNNING first, then PENDING, then others by created_at (newest first)
-                    status_priority = {"RUNNING": 0, "PENDING": 1, "COMPLETED": 2, "FAILED": 3, "CANCELLED": 4}
-                    
-                    # Sort by status priority and created_at (descending)
-                    sorted_runs = sorted(
-                        runs, 
-                        key=lambda x: (
-                            status_priority.get(x.get("status", ""), 999),
-                            x.get("created_at", "2000-01-01") or "2000-01-01"
-                        ),
-                        reverse=False  # Status ascending
-                    )
-                    
-                    # Now reverse within each status group to get newest first
-                    final_sorted = []
-                    current_status = None
-                    current_group = []
-                    
-                    for run in sorted_runs:
-                        run_status = run.get("status", "")
-                        if current_status is None:
-                            current_status = run_status
-                        
-                        if run_status == current_status:
-                            current_group.append(run)
-                        else:
-                            # Reverse current group and add to final
-                            current_group.reverse()
-                            final_sorted.extend(current_group)
-                            # Start new group
-                            current_status = run_status
-                            current_group = [run]
-                    
-                    # Don't forget the last group
-                    if current_group:
-                        current_group.reverse()
-                        final_sorted.extend(current_group)
-                    
-                    sorted_runs = final_sorted
-                    
-                    # Create a selection table
-                    st.write(f"Found **{len(sorted_runs)}** backtest runs (sorted by status and time):")
-                    
-                    # Build selection options with status emoji
-                    options = []
-                    for run in sorted_runs:
-                        status = run.get("status", "UNKNOWN")
-                        status_emoji = {
-                            "PENDING": "⏳",
-                            "RUNNING": "🏃",
-                            "COMPLETED": "✅",
-                            "FAILED": "❌",
-                            "CANCELLED": "🛑"
-                        }.get(status, "❓")
-                        
-                        run_name = run.get("run_name", "N/A")
-                        created_at = run.get("created_at", "")
-                        created_display = created_at[:19] if created_at else "N/A"
-                        total_trades = run.get("total_trades")
-                        trades_display = f"{total_trades} trades" if total_trades is not None else "No trades"
-                        
-                        option_text = f"{status_emoji} {status} | {run_name} | {created_display} | {trades_display}"
-                        options.append(option_text)
-                    
-                    # Selection box
-                    selected_idx = st.selectbox(
-                        "Choose a run:",
-                        range(len(sorted_runs)),
-                        format_func=lambda i: options[i],
-                        key="monitor_run_selector"
-                    )
-                    
-                    # Store selected run
-                    monitor_run_id = sorted_runs[selected_idx]["run_id"]
-                    
-                    # Add manual input option for advanced users
-                    with st.expander("🔧 Advanced: Enter Run ID Manually"):
-                        manual_run_id = st.text_input(
-                            "Manual Run ID",
-                            value="",
-                            placeholder="Paste run_id here if not in list",
-                            key="manual_run_id_input"
-                        )
-                        if manual_run_id:
-                            monitor_run_id = manual_run_id
-                            st.info(f"Using manual run_id: `{manual_run_id[:8]}...`")
-                    
-                else:
-                    st.info("📝 No backtest runs found yet.")
-                    st.write("**Get started:**")
-                    st.write("1. Go to the **'⚙️ New Backtest'** tab")
-                    st.write("2. Configure your backtest parameters")
-                    st.write("3. Click **'🚀 Start Backtest'**")
-                    st.write("4. Come back here to monitor progress!")
-                    monitor_run_id = None
-                    
+        if runs and len(runs) > 0:
+            # RUNNING first, then PENDING, then the rest; newest first within each status.
+            # With reverse=True, negating the priority keeps statuses ascending while times descend
+            sorted_runs = sorted(
+                runs,
+                key=lambda run: (-STATUS_PRIORITY.get(run.get("status", "UNKNOWN"), 999), run.get("created_at") or "2000-01-01"),
+                reverse=True
+            )
+            run_ids = [run["run_id"] for run in sorted_runs]
+            options = [
+                f"{STATUS_EMOJI.get(run.get('status', 'UNKNOWN'), '❓')} {run.get('status', 'UNKNOWN')} | "
+                f"{run.get('run_name', 'N/A')} | {(run.get('created_at') or 'N/A')[:19]} | "
+                f"{run['total_trades'] if run.get('total_trades') is not None else 'No'} trades"
+                for run in sorted_runs
+            ]
+            
+            # Create a selection table
+            st.write(f"Found **{len(run_ids)}** backtest runs (sorted by status and time):")
+            
+            # Selection box
+            selected_idx = st.selectbox(
+                "Choose a run:",
+                range(len(run_ids)),
+                format_func=lambda i: options[i],
+                key="monitor_run_selector"
+            )
+            
+            # Store selected run
+            monitor_run_id = run_ids[selected_idx]
+            
+            # Add manual input option for advanced users
+            with st.expander("🔧 Advanced: Enter Run ID Manually"):
+                manual_run_id = st.text_input(
+                    "Manual Run ID",
+                    value="",
+                    placeholder="Paste run_id here if not in list",
+                    key="manual_run_id_input"
+                )
+                if manual_run_id:
+                    monitor_run_id = manual_run_id
+                    st.info(f"Using manual run_id: `{manual_run_id[:8]}...`")
+            
         else:
-            st.error(f"❌ Failed to fetch runs: {response.status_code} - {response.text}")
+            st.info("📝 No backtest runs found yet.")
+            st.markdown(
+                "**Get started:**\n"
+                "1. Go to the **'⚙️ New Backtest'** tab\n"
+                "2. Configure your backtest parameters\n"
+                "3. Click **'🚀 Start Backtest'**\n"
+                "4. Come back here to monitor progress!"
+            )
             monitor_run_id = None
             
     except Exception as e:
@@ -423,178 +876,18 @@ with tab_monitor:
     if monitor_run_id:
         st.write("---")
         st.write(f"### 📊 Monitoring: `{monitor_run_id[:8]}...`")
+        auto_refresh = st.checkbox(
+            f"Auto-refresh every {MONITOR_REFRESH_INTERVAL}s while the run is active",
+            value=True,
+            key="monitor_auto_refresh"
+        )
         
-        col1, col2 = st.columns([4, 1])
-        with col1:
-            st.caption("Auto-refresh: Use the refresh button to update status")
-        with col2:
-            if st.button("🔄 Update Status", use_container_width=True, key="refresh_status_detail"):
-                st.rerun()
-        
-        try:
-            # Fetch status
-            response = requests.get(
-                f"{API_BASE_URL}/backtesting/status/{monitor_run_id}",
-                auth=AUTH,
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                data, error = safe_get_json_response(response)
-                if error:
-                    st.error(f"❌ {error}")
-                else:
-                    status_data = data
-                    
-                    # Display status
-                    status = status_data.get("status", "UNKNOWN")
-                    status_emoji = {
-                        "PENDING": "⏳",
-                        "RUNNING": "🏃",
-                        "COMPLETED": "✅",
-                        "FAILED": "❌",
-                        "CANCELLED": "🛑"
-                    }.get(status, "❓")
-                    
-                    st.write(f"### {status_emoji} Status: **{status}**")
-                    
-                    # Display key metrics
-                    col1, col2, col3, col4 = st.columns(4)
-                    
-                    with col1:
-                        st.metric("Run Name", status_data.get("run_name", "N/A"))
-                        
-                    with col2:
-                        st.metric("Controller", status_data.get("controller_name", "N/A"))
-                        
-                    with col3:
-                        total_trades = status_data.get("total_trades")
-                        st.metric("Total Trades", total_trades if total_trades is not None else "N/A")
-                        
-                    with col4:
-                        net_pnl_pct = status_data.get("net_pnl_pct")
-                        pnl_display = safe_float_format(net_pnl_pct, precision=2, multiplier=100, suffix="%")
-                        st.metric("Net PnL", pnl_display, delta=pnl_display if net_pnl_pct is not None else None)
-                    
-                    # Show more metrics if completed
-                    if status == "COMPLETED":
-                        st.write("---")
-                        col1, col2, col3, col4 = st.columns(4)
-                        
-                        with col1:
-                            win_rate = status_data.get("win_rate")
-                            win_rate_display = safe_float_format(win_rate, precision=1, multiplier=100, suffix="%")
-                            st.metric("Win Rate", win_rate_display)
-                        
-                        with col2:
-                            sharpe = status_data.get("sharpe_ratio")
-                            sharpe_display = safe_float_format(sharpe, precision=2)
-                            st.metric("Sharpe Ratio", sharpe_display)
-                        
-                        with col3:
-                            max_dd = status_data.get("max_drawdown")
-                            max_dd_display = safe_float_format(max_dd, precision=2, multiplier=100, suffix="%")
-                            st.metric("Max Drawdown", max_dd_display)
-                        
-                        with col4:
-                            net_pnl_quote = status_data.get("net_pnl_quote")
-                            net_pnl_quote_display = safe_float_format(net_pnl_quote, precision=2, prefix="$")
-                            st.metric("Net PnL (USDT)", net_pnl_quote_display)
-                    
-                    # Show timing info
-                    with st.expander("⏱️ Timing Details"):
-                        st.write(f"**Created:** {status_data.get('created_at', 'N/A')}")
-                        st.write(f"**Started:** {status_data.get('started_at', 'N/A')}")
-                        st.write(f"**Completed:** {status_data.get('completed_at', 'N/A')}")
-                    
-                    # Show error if failed
-                    if status == "FAILED":
-                        st.error(f"**Error:** {status_data.get('error_message', 'Unknown error')}")
-                    
-                    # Show stop button if running
-                    if status in ["PENDING", "RUNNING"]:
-                        col1, col2 = st.columns([1, 1])
-                        with col1:
-                            if st.button("🛑 Stop Backtest", type="secondary", use_container_width=True):
-                                try:
-                                    stop_response = requests.post(
-                                        f"{API_BASE_URL}/backtesting/stop/{monitor_run_id}",
-                                        auth=AUTH,
-                                        timeout=10
-                                    )
-                                    
-                                    if stop_response.status_code == 200:
-                                        st.success("✅ Stop signal sent")
-                                        time.sleep(1)
-                                        st.rerun()
-                                    else:
-                                        st.error(f"❌ Failed to stop: {stop_response.text}")
-                                except Exception as e:
-                                    st.error(f"❌ Error: {e}")
-                        
-                        with col2:
-                            if st.button("📜 View Live Logs", type="primary", use_container_width=True):
-                                st.session_state["view_live_logs_run_id"] = monitor_run_id
-                                st.rerun()
-                    
-                    # Show results button if completed
-                    if status == "COMPLETED":
-                        st.write("---")
-                        col1, col2 = st.columns([1, 1])
-                        with col1:
-                            if st.button("📊 View Full Results", type="primary", use_container_width=True):
-                                st.session_state["view_results_run_id"] = monitor_run_id
-                                st.rerun()
-                        with col2:
-                            if st.button("📜 View All Logs", type="secondary", use_container_width=True):
-                                st.session_state["view_live_logs_run_id"] = monitor_run_id
-                                st.rerun()
-                    
-                    # Live logs preview (for RUNNING status)
-                    if status == "RUNNING" and "view_live_logs_run_id" not in st.session_state:
-                        st.write("---")
-                        st.write("#### 📜 Recent Logs (Last 10)")
-                        
-                        try:
-                            logs_response = requests.get(
-                                f"{API_BASE_URL}/backtesting/results/{monitor_run_id}",
-                                params={"include_logs": True, "log_limit": 10},
-                                auth=AUTH,
-                                timeout=10
-                            )
-                            
-                            if logs_response.status_code == 200:
-                                logs_data, logs_error = safe_get_json_response(logs_response)
-                                if not logs_error:
-                                    logs = logs_data.get("logs", [])
-                                    if logs:
-                                        for log in reversed(logs[-10:]):  # Show most recent first
-                                            if not isinstance(log, dict):
-                                                continue
-                                            
-                                            log_level = log.get("log_level", "INFO")
-                                            log_emoji = {
-                                                "INFO": "ℹ️",
-                                                "DEBUG": "🐛",
-                                                "WARNING": "⚠️",
-                                                "ERROR": "❌"
-                                            }.get(log_level, "📝")
-                                            
-                                            timestamp = log.get("timestamp", "")[:19]
-                                            category = log.get("log_category", "UNKNOWN")
-                                            message = log.get("log_message", "")[:150]
-                                            
-                                            st.text(f"{log_emoji} [{timestamp}] {category}: {message}...")
-                                    else:
-                                        st.info("No logs yet")
-                        except Exception as e:
-                            st.warning(f"Could not fetch logs: {e}")
-                
-            else:
-                st.error(f"❌ Failed to fetch status: {response.status_code} - {response.text}")
-                
-        except Exception as e:
-            st.error(f"❌ Error fetching status: {e}")
+        # Poll only once this run has been seen PENDING or RUNNING, unseen runs start without the timer
+        last_seen = st.session_state.get("monitor_last_status")
+        polling = auto_refresh and last_seen in [(monitor_run_id, "PENDING"), (monitor_run_id, "RUNNING")]
+        st.fragment(run_every=MONITOR_REFRESH_INTERVAL if polling else None)(monitor_run_detail)(
+            monitor_run_id, auto_refresh, polling
+        )
 
 with tab_history:
     st.write("#### Backtest History")
@@ -612,88 +905,45 @@ with tab_history:
         st.write("")  # Spacing
         refresh_history = st.button("🔄 Refresh History", use_container_width=True)
     
+    status = None if filter_status == "All" else filter_status
+    if refresh_history:
+        fetch_runs.clear(history_limit, status)
+    
     try:
-        # Build query params
-        params = {"limit": history_limit}
-        if filter_status != "All":
-            params["status"] = filter_status
+        # Only refetch when the filters changed or a refresh was requested
+        history_key = (history_limit, filter_status)
+        if refresh_history or st.session_state.get("history_key") != history_key:
+            st.session_state["history_runs"] = fetch_runs(history_limit, status).get("runs", [])
+            st.session_state["history_key"] = history_key
+        runs = st.session_state["history_runs"]
         
-        response = requests.get(
-            f"{API_BASE_URL}/backtesting/list",
-            params=params,
-            auth=AUTH,
-            timeout=10
-        )
-        
-        if response.status_code == 200:
-            data, error = safe_get_json_response(response)
-            if error:
-                st.error(f"❌ {error}")
-            else:
-                runs = data.get("runs", [])
-                
-                if runs:
-                    st.write(f"Found **{len(runs)}** backtest runs:")
-                    
-                    # Convert to DataFrame for better display
-                    df_data = []
-                    for run in runs:
-                        # Safely get total_trades with None check
-                        total_trades = run.get("total_trades")
-                        trades_display = total_trades if total_trades is not None else 0
-                        
-                        # Safely format net_pnl_pct
-                        net_pnl_pct = run.get("net_pnl_pct")
-                        pnl_display = safe_float_format(net_pnl_pct, precision=2, multiplier=100, suffix="%")
-                        
-                        # Safely format win_rate
-                        win_rate = run.get("win_rate")
-                        win_rate_display = safe_float_format(win_rate, precision=1, multiplier=100, suffix="%")
-                        
-                        # Safely get created_at
-                        created_at = run.get("created_at")
-                        created_display = created_at[:19] if created_at else "N/A"
-                        
-                        df_data.append({
-                            "Run ID": run["run_id"][:8] + "...",
-                            "Name": run.get("run_name", "N/A"),
-                            "Controller": run.get("controller_name", "N/A"),
-                            "Status": run.get("status", "UNKNOWN"),
-                            "Trades": trades_display,
-                            "Net PnL %": pnl_display,
-                            "Win Rate": win_rate_display,
-                            "Created": created_display,
-                            "Full Run ID": run["run_id"]
-                        })
-                    
-                    df = pd.DataFrame(df_data)
-                    
-                    # Display table (hide full run_id column)
-                    st.dataframe(
-                        df.drop(columns=["Full Run ID"]),
-                        use_container_width=True,
-                        hide_index=True
-                    )
-                    
-                    # Allow selection to view details
-                    st.write("---")
-                    selected_idx = st.selectbox(
-                        "Select a run to view details:",
-                        range(len(runs)),
-                        format_func=lambda i: f"{runs[i]['run_name']} - {runs[i]['status']}"
-                    )
-                    
-                    if st.button("📊 View Selected Run", use_container_width=True):
-                        selected_run_id = runs[selected_idx]["run_id"]
-                        st.session_state["view_results_run_id"] = selected_run_id
-                        st.rerun()
-                        
-                else:
-                    st.info("No backtest runs found")
+        if runs:
+            st.write(f"Found **{len(runs)}** backtest runs:")
+            
+            st.dataframe(
+                build_history_table(runs),
+                use_container_width=True,
+                hide_index=True,
+                column_config={"Created": st.column_config.DatetimeColumn(format="YYYY-MM-DD HH:mm:ss")}
+            )
+            
+            # Allow selection to view details
+            st.write("---")
+            selected_idx = st.selectbox(
+                "Select a run to view details:",
+                range(len(runs)),
+                format_func=lambda i: f"{runs[i]['run_name']} - {runs[i]['status']}"
+            )
+            
+            if st.button("📊 View Selected Run", use_container_width=True):
+                selected_run_id = runs[selected_idx]["run_id"]
+                st.session_state["view_results_run_id"] = selected_run_id
+                st.session_state["view_results_version"] = time.time()
+                st.rerun()
                 
         else:
-            st.error(f"❌ Failed to fetch history: {response.status_code} - {response.text}")
-            
+            st.info("No backtest runs found")
+        
     except Exception as e:
         st.error(f"❌ Error fetching history: {e}")
 
@@ -726,10 +976,9 @@ if "view_live_logs_run_id" in st.session_state:
         with col2:
             auto_scroll = st.checkbox("Show newest first", value=True)
         
-        response = requests.get(
-            f"{API_BASE_URL}/backtesting/results/{run_id}",
+        response = SESSION.get(
+            BACKTESTING_RESULTS_URL.format(run_id=run_id),
             params={"include_logs": True, "log_limit": log_limit},
-            auth=AUTH,
             timeout=30
         )
         
@@ -743,11 +992,7 @@ if "view_live_logs_run_id" in st.session_state:
                 if logs:
                     # Filter by category
                     try:
-                        log_categories = sorted(list(set(
-                            log.get("log_category", "UNKNOWN") 
-                            for log in logs 
-                            if isinstance(log, dict)
-                        )))
+                        log_categories = sorted({log.get("log_category", "UNKNOWN") for log in logs if isinstance(log, dict)})
                     except Exception:
                         log_categories = ["UNKNOWN"]
                     
@@ -757,42 +1002,39 @@ if "view_live_logs_run_id" in st.session_state:
                     with col2:
                         selected_level = st.selectbox("Filter by Level", ["All", "INFO", "DEBUG", "WARNING", "ERROR"], key="live_log_level")
                     
-                    # Filter logs
-                    filtered_logs = logs
-                    if selected_category != "All":
-                        filtered_logs = [log for log in filtered_logs if isinstance(log, dict) and log.get("log_category") == selected_category]
-                    if selected_level != "All":
-                        filtered_logs = [log for log in filtered_logs if isinstance(log, dict) and log.get("log_level") == selected_level]
-                    
-                    # Reverse if newest first
-                    if auto_scroll:
-                        filtered_logs = list(reversed(filtered_logs))
+                    # Filter logs in one pass, newest first via the slice step
+                    step = -1 if auto_scroll else 1
+                    if selected_category == "All" and selected_level == "All":
+                        filtered_logs = logs[::step]
+                    else:
+                        filtered_logs = [
+                            log for log in logs
+                            if isinstance(log, dict)
+                            and (selected_category == "All" or log.get("log_category") == selected_category)
+                            and (selected_level == "All" or log.get("log_level") == selected_level)
+                        ][::step]
                     
                     st.write(f"**Showing {len(filtered_logs)} logs:**")
                     
-                    # Display logs in a container
-                    with st.container():
-                        for log in filtered_logs:
-                            if not isinstance(log, dict):
-                                continue
-                            
-                            log_level = log.get("log_level", "INFO")
-                            log_emoji = {
-                                "INFO": "ℹ️",
-                                "DEBUG": "🐛",
-                                "WARNING": "⚠️",
-                                "ERROR": "❌"
-                            }.get(log_level, "📝")
-                            
-                            timestamp = log.get("timestamp", "")
-                            timestamp_display = timestamp[:19] if timestamp else "N/A"
-                            
-                            log_category = log.get("log_category", "UNKNOWN")
-                            log_message = log.get("log_message", "")
-                            message_preview = log_message[:100] if log_message else "Empty log"
-                            
-                            with st.expander(f"{log_emoji} [{timestamp_display}] {log_category} - {message_preview}"):
-                                st.text(log_message)
+                    # Render all logs in one virtualized table instead of one expander per log
+                    log_records = [log for log in filtered_logs if isinstance(log, dict)]
+                    if log_records:
+                        logs_df = pd.DataFrame.from_records(
+                            log_records,
+                            columns=["timestamp", "log_level", "log_category", "log_message"]
+                        )
+                        log_levels = logs_df["log_level"].fillna("INFO")
+                        st.dataframe(
+                            pd.DataFrame({
+                                "Time": logs_df["timestamp"].fillna("").astype(str).str.slice(0, 19).replace("", "N/A"),
+                                "Level": log_levels.map(LOG_LEVEL_EMOJI).fillna("📝") + " " + log_levels,
+                                "Category": logs_df["log_category"].fillna("UNKNOWN"),
+                                "Message": logs_df["log_message"].fillna(""),
+                            }),
+                            use_container_width=True,
+                            hide_index=True,
+                            height=600
+                        )
                 else:
                     st.info("No logs available yet")
         else:
@@ -812,135 +1054,121 @@ if "view_results_run_id" in st.session_state:
     
     run_id = st.session_state["view_results_run_id"]
     
-    col1, col2 = st.columns([4, 1])
+    col1, col2, col3 = st.columns([3, 1, 1])
     with col1:
         st.write(f"**Run ID:** `{run_id}`")
     with col2:
+        refetch_results = st.checkbox(
+            "Refetch on every rerun",
+            value=False,
+            key="results_refetch",
+            help="Refetch the results whenever the page reruns instead of reusing the loaded ones"
+        )
+    with col3:
         if st.button("❌ Close Results"):
             del st.session_state["view_results_run_id"]
+            st.session_state.pop("results_cache", None)
+            fetch_results_logs.clear(run_id)
             st.rerun()
     
     try:
-        # Fetch full results
-        response = requests.get(
-            f"{API_BASE_URL}/backtesting/results/{run_id}",
-            params={"include_logs": True, "log_limit": 100},
-            auth=AUTH,
-            timeout=30
-        )
+        # Fetch summary and trades only when a run was (re)opened or refetching is on,
+        # logs are fetched on request below
+        results_version = (run_id, st.session_state.get("view_results_version"))
+        results_cache = st.session_state.get("results_cache")
+        if refetch_results or results_cache is None or results_cache[0] != results_version:
+            fetch_results_logs.clear(run_id)
+            results_cache = (results_version, fetch_results(run_id))
+            st.session_state["results_cache"] = results_cache
+        results = results_cache[1]
         
-        if response.status_code == 200:
-            results, error = safe_get_json_response(response)
-            if error:
-                st.error(f"❌ {error}")
-            else:
-                # Display summary
-                run_info = results.get("run_info", {})
-                trades = results.get("trades", [])
-                logs = results.get("logs", [])
-                
-                # Metrics
-                col1, col2, col3, col4, col5 = st.columns(5)
-                
-                with col1:
-                    total_trades = run_info.get("total_trades")
-                    st.metric("Total Trades", total_trades if total_trades is not None else 0)
-                with col2:
-                    net_pnl_pct = run_info.get("net_pnl_pct")
-                    pnl_display = safe_float_format(net_pnl_pct, precision=2, multiplier=100, suffix="%")
-                    st.metric("Net PnL", pnl_display)
-                with col3:
-                    win_rate = run_info.get("win_rate")
-                    win_rate_display = safe_float_format(win_rate, precision=1, multiplier=100, suffix="%")
-                    st.metric("Win Rate", win_rate_display)
-                with col4:
-                    sharpe = run_info.get("sharpe_ratio")
-                    sharpe_display = safe_float_format(sharpe, precision=2)
-                    st.metric("Sharpe", sharpe_display)
-                with col5:
-                    max_dd = run_info.get("max_drawdown")
-                    max_dd_display = safe_float_format(max_dd, precision=2, multiplier=100, suffix="%")
-                    st.metric("Max DD", max_dd_display)
+        # Display summary
+        run_info = results.get("run_info", {})
+        trades = results.get("trades", [])
+        
+        # Metrics
+        col1, col2, col3, col4, col5 = st.columns(5)
+        
+        with col1:
+            total_trades = run_info.get("total_trades")
+            st.metric("Total Trades", total_trades if total_trades is not None else 0)
+        with col2:
+            net_pnl_pct = run_info.get("net_pnl_pct")
+            pnl_display = safe_float_format(net_pnl_pct, precision=2, multiplier=100, suffix="%")
+            st.metric("Net PnL", pnl_display)
+        with col3:
+            win_rate = run_info.get("win_rate")
+            win_rate_display = safe_float_format(win_rate, precision=1, multiplier=100, suffix="%")
+            st.metric("Win Rate", win_rate_display)
+        with col4:
+            sharpe = run_info.get("sharpe_ratio")
+            sharpe_display = safe_float_format(sharpe, precision=2)
+            st.metric("Sharpe", sharpe_display)
+        with col5:
+            max_dd = run_info.get("max_drawdown")
+            max_dd_display = safe_float_format(max_dd, precision=2, multiplier=100, suffix="%")
+            st.metric("Max DD", max_dd_display)
+        
+        # Trades table
+        if trades:
+            st.write("---")
+            st.write(f"#### 💼 Trades ({len(trades)})")
+            
+            st.dataframe(
+                build_trades_table(trades),
+                use_container_width=True,
+                hide_index=True,
+                column_config=TRADES_COLUMN_CONFIG
+            )
+        
+        # Logs section
+        st.write("---")
+        logs = []
+        if st.checkbox("📜 Load Logs", value=False, key="results_load_logs"):
+            # Drop invalid entries once, everything below works on log dicts only
+            logs = [log for log in fetch_results_logs(run_id) if isinstance(log, dict)]
+            if not logs:
+                st.info("No logs available for this run")
+        
+        if logs:
+            st.write(f"#### 📜 Logs ({len(logs)})")
+            
+            # Group logs by category once so filtering is a dictionary lookup
+            logs_by_category = {}
+            for log in logs:
+                logs_by_category.setdefault(log.get("log_category", "UNKNOWN"), []).append(log)
+            
+            selected_category = st.selectbox("Filter by Category", ["All"] + sorted(logs_by_category))
+            
+            filtered_logs = logs if selected_category == "All" else logs_by_category.get(selected_category, [])
+            
+            # Only render one page of expanders per rerun
+            page_count = max(1, (len(filtered_logs) + LOGS_PAGE_SIZE - 1) // LOGS_PAGE_SIZE)
+            page = 1
+            if page_count > 1:
+                page = st.number_input(
+                    f"Page (of {page_count})",
+                    min_value=1,
+                    max_value=page_count,
+                    value=1,
+                    key=f"results_log_page_{selected_category}"
+                )
+            
+            # Display logs with safe parsing
+            for log in filtered_logs[(page - 1) * LOGS_PAGE_SIZE:page * LOGS_PAGE_SIZE]:
+                log_level = log.get("log_level", "INFO")
+                log_emoji = LOG_LEVEL_EMOJI.get(log_level, "📝")
                 
-                # Trades table
-                if trades:
-                    st.write("---")
-                    st.write(f"#### 💼 Trades ({len(trades)})")
-                    
-                    trades_df_data = []
-                    for t in trades:
-                        # Safely handle all fields with None checks
-                        entry_price = t.get("entry_price", 0)
-                        exit_price = t.get("exit_price")
-                        amount = t.get("amount", 0)
-                        net_pnl_pct = t.get("net_pnl_pct", 0)
-                        net_pnl_quote = t.get("net_pnl_quote", 0)
-                        
-                        trades_df_data.append({
-                            "Symbol": t.get("trading_pair", "N/A"),
-                            "Side": t.get("side", "N/A"),
-                            "Entry Price": f"${entry_price:.2f}" if entry_price else "N/A",
-                            "Exit Price": f"${exit_price:.2f}" if exit_price else "N/A",
-                            "Amount": f"{amount:.4f}" if amount else "N/A",
-                            "PnL %": f"{net_pnl_pct*100:.2f}%" if net_pnl_pct is not None else "N/A",
-                            "PnL Quote": f"${net_pnl_quote:.2f}" if net_pnl_quote is not None else "N/A",
-                            "Close Type": t.get("close_type", "N/A"),
-                            "Status": t.get("status", "N/A")
-                        })
-                    
-                    trades_df = pd.DataFrame(trades_df_data)
-                    st.dataframe(trades_df, use_container_width=True, hide_index=True)
+                timestamp_display = (log.get("timestamp") or "")[:19] or "N/A"
+                log_category = log.get("log_category", "UNKNOWN")
+                log_message = log.get("log_message") or ""
                 
-                # Logs section
-                if logs:
-                    st.write("---")
-                    st.write(f"#### 📜 Logs ({len(logs)})")
-                    
-                    # Filter logs by category - safely handle empty or invalid log entries
-                    try:
-                        log_categories = sorted(list(set(
-                            log.get("log_category", "UNKNOWN") 
-                            for log in logs 
-                            if isinstance(log, dict)
-                        )))
-                    except Exception as e:
-                        st.warning(f"⚠️ Error parsing log categories: {e}")
-                        log_categories = ["UNKNOWN"]
-                    
-                    selected_category = st.selectbox("Filter by Category", ["All"] + log_categories)
-                    
-                    filtered_logs = logs
-                    if selected_category != "All":
-                        filtered_logs = [
-                            log for log in logs 
-                            if isinstance(log, dict) and log.get("log_category") == selected_category
-                        ]
-                    
-                    # Display logs with safe parsing
-                    for log in filtered_logs:
-                        if not isinstance(log, dict):
-                            continue
-                            
-                        log_level = log.get("log_level", "INFO")
-                        log_emoji = {
-                            "INFO": "ℹ️",
-                            "DEBUG": "🐛",
-                            "WARNING": "⚠️",
-                            "ERROR": "❌"
-                        }.get(log_level, "📝")
-                        
-                        timestamp = log.get("timestamp", "")
-                        timestamp_display = timestamp[:19] if timestamp else "N/A"
-                        
-                        log_category = log.get("log_category", "UNKNOWN")
-                        log_message = log.get("log_message", "")
-                        message_preview = log_message[:100] if log_message else "Empty log"
-                        
-                        with st.expander(f"{log_emoji} [{timestamp_display}] {log_category} - {message_preview}"):
-                            st.text(log_message)
-            
-        else:
-            st.error(f"❌ Failed to fetch results: {response.status_code} - {response.text}")
+                with st.expander(f"{log_emoji} [{timestamp_display}] {log_category} - {log_message[:100] or 'Empty log'}"):
+                    st.text(log_message)
+        
+        # Logs of a run still in progress must not be served from the shared cache
+        if run_info.get("status") in ["PENDING", "RUNNING"]:
+            fetch_results_logs.clear(run_id)
             
     except Exception as e:
         st.error(f"❌ Error fetching results: {e}")
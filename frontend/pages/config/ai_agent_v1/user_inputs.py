@@ -38,7 +38,12 @@ def user_inputs():
             value=default_config.get("trading_pairs_str", "BTC-USDT\nETH-USDT"),
             height=100
         )
-        trading_pairs = [pair.strip() for pair in trading_pairs_str.split("\n") if pair.strip()]
+        # Only re-parse when the text changed since the last rerun
+        parsed = st.session_state.get("parsed_trading_pairs")
+        if parsed is None or parsed[0] != trading_pairs_str:
+            parsed = (trading_pairs_str, [pair.strip() for pair in trading_pairs_str.split("\n") if pair.strip()])
+            st.session_state["parsed_trading_pairs"] = parsed
+        trading_pairs = parsed[1]
         st.info(f"📊 Monitoring {len(trading_pairs)} trading pairs")
     
     # ==================== AI 配置 ====================
@@ -7,14 +7,24 @@ This script tests all the endpoints used by the dashboard interface.
 
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Configuration
 API_BASE_URL = "http://localhost:8010"
 AUTH = ("admin", "admin")
 
+# One pooled session for all requests, so the connection to the API is reused
+SESSION = requests.Session()
+SESSION.auth = AUTH
+_adapter = HTTPAdapter(pool_maxsize=10, max_retries=Retry(total=3, backoff_factor=0.3))
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
 def test_start_backtest():
     """Test starting a new backtest"""
     print("\n" + "="*80)
@@ -62,10 +72,9 @@ def test_start_backtest():
     }
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{API_BASE_URL}/backtesting/start",
             json=payload,
-            auth=AUTH,
             timeout=10
         )
         
@@ -85,18 +94,29 @@ def test_start_backtest():
         return None
 
 
-def test_get_status(run_id):
-    """Test getting backtest status"""
+def get_status(run_id):
+    return SESSION.get(
+        f"{API_BASE_URL}/backtesting/status/{run_id}",
+        timeout=10
+    )
+
+
+def list_backtests():
+    return SESSION.get(
+        f"{API_BASE_URL}/backtesting/list",
+        params={"limit": 10, "status": "COMPLETED"},
+        timeout=10
+    )
+
+
+def test_get_status(run_id, pending=None):
+    """Test getting backtest status (pending: optional future of an already sent get_status request)"""
     print("\n" + "="*80)
     print("TEST 2: Get Status")
     print("="*80)
     
     try:
-        response = requests.get(
-            f"{API_BASE_URL}/backtesting/status/{run_id}",
-            auth=AUTH,
-            timeout=10
-        )
+        response = pending.result() if pending is not None else get_status(run_id)
         
         print(f"Status Code: {response.status_code}")
         
@@ -114,19 +134,14 @@ def test_get_status(run_id):
         return None
 
 
-def test_list_backtests():
-    """Test listing all backtests"""
+def test_list_backtests(pending=None):
+    """Test listing all backtests (pending: optional future of an already sent list_backtests request)"""
     print("\n" + "="*80)
     print("TEST 3: List Backtests")
     print("="*80)
     
     try:
-        response = requests.get(
-            f"{API_BASE_URL}/backtesting/list",
-            params={"limit": 10, "status": "COMPLETED"},
-            auth=AUTH,
-            timeout=10
-        )
+        response = pending.result() if pending is not None else list_backtests()
         
         print(f"Status Code: {response.status_code}")
         
@@ -158,10 +173,9 @@ def test_get_results(run_id):
     print("="*80)
     
     try:
-        response = requests.get(
+        response = SESSION.get(
             f"{API_BASE_URL}/backtesting/results/{run_id}",
             params={"include_logs": True, "log_limit": 10},
-            auth=AUTH,
             timeout=30
         )
         
@@ -209,9 +223,8 @@ def test_stop_backtest(run_id):
     print("="*80)
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{API_BASE_URL}/backtesting/stop/{run_id}",
-            auth=AUTH,
             timeout=10
         )
         
@@ -256,11 +269,16 @@ def main():
     print("\n⏳ Waiting 2 seconds...")
     time.sleep(2)
     
-    # Test 2: Get status
-    status = test_get_status(run_id)
-    
-    # Test 3: List all backtests
-    runs = test_list_backtests()
+    # Tests 2 and 3 are independent: send both requests at once, then report them in order
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        status_future = executor.submit(get_status, run_id)
+        runs_future = executor.submit(list_backtests)
+        
+        # Test 2: Get status
+        status = test_get_status(run_id, status_future)
+        
+        # Test 3: List all backtests
+        runs = test_list_backtests(runs_future)
     
     # Test 4: Get results (use a completed run if available)
     if runs: